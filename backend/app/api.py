@@ -1,20 +1,79 @@
 """FastAPI endpoints for frontend integration."""
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect, Request, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import StreamingResponse
+from fastapi.responses import StreamingResponse, JSONResponse, ORJSONResponse
 from pydantic import BaseModel
 import cv2
 import numpy as np
 import json
 import asyncio
-import base64
+import ipaddress
+import os
 import time
-from typing import Optional, List, Dict
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from multiprocessing import resource_tracker, shared_memory
+from typing import Optional, List, Dict, Tuple
+from app.config import config
 from app.orchestrator import SmartGlassesOrchestrator
+from app.pipeline import AsyncBatchQueue, BufferPool, decode_base64_frame, decode_frame
 from app.layers.layer1_sensor import Frame
 from app.layers.layer5_output import OutputMode
 
-app = FastAPI(title="Smart Glasses API")
+# Fast JSON serialization (falls back to the standard library)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    print("Warning: orjson not available. Install with: pip install orjson")
+
+# Global orchestrator instance
+orchestrator: Optional[SmartGlassesOrchestrator] = None
+frame_queue: Optional[AsyncBatchQueue] = None
+frame_counter = 0
+
+# Reusable buffers for raw request bodies
+body_pool = BufferPool()
+
+# Single inference thread: serializes GPU access and keeps model work off
+# the event loop (decoding runs on the default executor instead)
+inference_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="inference")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Load and warm up the models once, then clean up on shutdown."""
+    global orchestrator, frame_queue
+    # Frames are decoded on several threads (and possibly several workers);
+    # OpenCV's own thread pool on top of that only oversubscribes the cores
+    cv2.setNumThreads(config.opencv_threads)
+    
+    orchestrator = SmartGlassesOrchestrator()
+    orchestrator.start()
+    
+    # Frames from all clients are batched into shared forward passes
+    frame_queue = AsyncBatchQueue(
+        orchestrator.process_image_batch,
+        max_batch_size=config.batch_max_size,
+        max_wait_ms=config.batch_max_wait_ms,
+        executor=inference_executor
+    )
+    frame_queue.start()
+    
+    yield
+    
+    await frame_queue.stop()
+    inference_executor.shutdown(wait=True)
+    orchestrator.stop()
+
+
+app = FastAPI(
+    title="Smart Glasses API",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse if ORJSON_AVAILABLE else JSONResponse
+)
 
 # CORS middleware
 app.add_middleware(
@@ -25,9 +84,80 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Global orchestrator instance
-orchestrator: Optional[SmartGlassesOrchestrator] = None
-frame_counter = 0
+# Column indices into (x1, y1, x2, y2) giving the clockwise corners of a box
+OCR_POLYGON_CORNERS = np.array([[0, 1], [2, 1], [2, 3], [0, 3]])
+
+
+def dumps_json(payload: Dict) -> str:
+    """Serialize a message to JSON text, using orjson when available.
+    
+    Args:
+        payload: JSON-serializable message (NumPy values allowed with orjson)
+        
+    Returns:
+        JSON string
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+    return json.dumps(payload)
+
+
+def loads_json(text: str) -> Dict:
+    """Parse a JSON message, using orjson when available.
+    
+    Frame messages carry the whole base64 image as one string, so the
+    parser's string handling dominates; orjson scans it in native code.
+    
+    Args:
+        text: JSON text
+        
+    Returns:
+        Parsed message
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+def json_response(payload: Dict) -> JSONResponse:
+    """Wrap a response payload so FastAPI serializes it as-is.
+    
+    Returning a Response skips FastAPI's jsonable_encoder, a pure-Python
+    walk over the whole payload that runs even with ORJSONResponse as the
+    default response class.
+    
+    Args:
+        payload: JSON-serializable response body
+        
+    Returns:
+        ORJSONResponse when orjson is available, else JSONResponse
+    """
+    if ORJSON_AVAILABLE:
+        return ORJSONResponse(payload)
+    return JSONResponse(payload)
+
+
+async def send_message(websocket: WebSocket, payload: Dict):
+    """Send a JSON message over a WebSocket as a text frame.
+    
+    Args:
+        websocket: Connected WebSocket
+        payload: JSON-serializable message
+    """
+    await websocket.send_text(dumps_json(payload))
+
+
+def report_exception(context: str, error: Exception):
+    """Print an endpoint error, with the full traceback only in debug mode.
+    
+    Args:
+        context: Short description of where the error happened
+        error: Caught exception
+    """
+    if config.api_debug:
+        traceback.print_exc()
+    else:
+        print(f"{context}: {error}")
 
 
 class ImageRequest(BaseModel):
@@ -39,55 +169,61 @@ class ResponseFormatter:
     """Utility class for formatting API responses."""
     
     @staticmethod
-    def format_detections(perception_output) -> List[Dict]:
+    def format_detections(perception_output, scale: float = 1.0) -> List[Dict]:
         """Format YOLO detections for frontend.
         
         Args:
             perception_output: Perception output from orchestrator
+            scale: Factor mapping processed-image coordinates to frame coordinates
             
         Returns:
             List of formatted detections
         """
-        yolo_detections = []
-        for det in perception_output.detections:
-            yolo_detections.append({
-                "bbox": {
-                    "x1": float(det.bbox[0]),
-                    "y1": float(det.bbox[1]),
-                    "x2": float(det.bbox[2]),
-                    "y2": float(det.bbox[3])
-                },
+        detections = perception_output.detections
+        if not detections:
+            return []
+        
+        # Pack rows as [x1, y1, x2, y2, confidence], then scale boxes and convert
+        # confidence to percentage with one broadcast multiply and one unboxing
+        rows = np.asarray([(*det.bbox, det.confidence) for det in detections], dtype=np.float64)
+        rows = (rows * (scale, scale, scale, scale, 100.0)).tolist()
+        
+        return [
+            {
+                "bbox": {"x1": x1, "y1": y1, "x2": x2, "y2": y2},
                 "class": det.class_name,
-                "confidence": float(det.confidence * 100)  # Convert to percentage
-            })
-        return yolo_detections
+                "confidence": confidence
+            }
+            for det, (x1, y1, x2, y2, confidence) in zip(detections, rows)
+        ]
     
     @staticmethod
-    def format_ocr_results(perception_output) -> List:
+    def format_ocr_results(perception_output, scale: float = 1.0) -> List:
         """Format OCR results for frontend.
         
         Args:
             perception_output: Perception output from orchestrator
+            scale: Factor mapping processed-image coordinates to frame coordinates
             
         Returns:
             List of formatted OCR text detections
         """
-        ocr_text_detections = []
-        for text_region in perception_output.text_regions:
-            # Convert bbox to polygon format expected by frontend
-            x1, y1, x2, y2 = text_region.bbox
-            polygon = [
-                [float(x1), float(y1)],
-                [float(x2), float(y1)],
-                [float(x2), float(y2)],
-                [float(x1), float(y2)]
-            ]
-            ocr_text_detections.append([
-                text_region.text,
-                float(text_region.confidence),
-                polygon
-            ])
-        return ocr_text_detections
+        text_regions = perception_output.text_regions
+        if not text_regions:
+            return []
+        
+        # Convert all bboxes to the polygon format expected by frontend in one gather:
+        # [[x1, y1], [x2, y1], [x2, y2], [x1, y2]]
+        boxes = np.asarray([region.bbox for region in text_regions], dtype=np.float64) * scale
+        polygons = boxes[:, OCR_POLYGON_CORNERS].tolist()
+        
+        # Rows are (text, confidence, polygon) tuples; they serialize to the
+        # same JSON arrays as lists without per-row list allocation.
+        # TextRegion confidences are already Python floats
+        return [
+            (region.text, region.confidence, polygon)
+            for region, polygon in zip(text_regions, polygons)
+        ]
     
     @staticmethod
     def format_processing_response(
@@ -127,53 +263,157 @@ class ResponseFormatter:
         }
 
 
-class ImageProcessor:
-    """Utility class for processing images from base64."""
+async def process_decoded_image(image: np.ndarray, scale: float) -> Dict:
+    """Run a decoded frame through the batched pipeline and format the response.
     
-    @staticmethod
-    def decode_base64_image(image_data: str) -> Optional[np.ndarray]:
-        """Decode base64 image string to numpy array.
+    Args:
+        image: Decoded image (BGR format)
+        scale: Factor mapping processed-image coordinates to frame coordinates
+            (as returned by decode_frame)
         
-        Args:
-            image_data: Base64 encoded image (may include data URL prefix)
-            
-        Returns:
-            Decoded image as numpy array, or None if decoding fails
-        """
-        try:
-            # Remove data URL prefix if present
-            if "," in image_data:
-                image_data = image_data.split(",")[1]
-            
-            # Decode base64 to bytes
-            image_bytes = base64.b64decode(image_data)
-            
-            # Convert bytes to numpy array
-            nparr = np.frombuffer(image_bytes, np.uint8)
-            
-            # Decode image
-            image = cv2.imdecode(nparr, cv2.IMREAD_COLOR)
-            
-            return image
-        except Exception as e:
-            print(f"Error decoding image: {e}")
-            return None
+    Returns:
+        Formatted response dictionary
+    """
+    global frame_counter
+    
+    frame_counter += 1
+    frame_id = frame_counter
+    results = await frame_queue.add_request((image, frame_id))
+    
+    # Batched results are always built with logs, so they carry the
+    # perception output (the models are only touched on the inference thread)
+    perception_output = results["perception_output"]
+    
+    # Format responses
+    formatter = ResponseFormatter()
+    yolo_detections = formatter.format_detections(perception_output, scale=scale)
+    ocr_text_detections = formatter.format_ocr_results(perception_output, scale=scale)
+    
+    return formatter.format_processing_response(
+        results, frame_id, yolo_detections, ocr_text_detections
+    )
 
 
-@app.on_event("startup")
-async def startup():
-    """Initialize orchestrator on startup."""
-    global orchestrator
-    orchestrator = SmartGlassesOrchestrator()
-    orchestrator.start()
+def raise_frame_too_large():
+    """Reject an upload larger than ``config.max_frame_bytes``."""
+    raise HTTPException(
+        status_code=413,
+        detail=f"Image exceeds the {config.max_frame_bytes} byte limit"
+    )
 
 
-@app.on_event("shutdown")
-async def shutdown():
-    """Cleanup on shutdown."""
-    global orchestrator
-    if orchestrator:
-        orchestrator.stop()
+async def read_image_body(request: Request) -> Tuple[Optional[np.ndarray], float]:
+    """Read a raw encoded image from the request body and decode it.
+    
+    When Content-Length is known the body is streamed straight into a
+    pooled buffer, instead of Starlette joining the received chunks into a
+    new bytes object per request. Bodies over ``config.max_frame_bytes``
+    are rejected with 413 before anything is buffered.
+    
+    Args:
+        request: Incoming request whose body is the encoded image
+        
+    Returns:
+        (decoded image, or None if the body is empty or invalid;
+        coordinate scale back to the uploaded frame)
+    """
+    try:
+        content_length = int(request.headers.get("content-length") or 0)
+        if content_length < 0:
+            raise ValueError(content_length)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid Content-Length header")
+    if content_length > config.max_frame_bytes:
+        raise_frame_too_large()
+    
+    if not content_length:
+        # No length up front (chunked upload): enforce the limit while reading
+        chunks = []
+        nbytes = 0
+        async for chunk in request.stream():
+            nbytes += len(chunk)
+            if nbytes > config.max_frame_bytes:
+                raise_frame_too_large()
+            chunks.append(chunk)
+        if not nbytes:
+            return None, 1.0
+        return await asyncio.to_thread(decode_frame, b"".join(chunks))
+    
+    buffer = body_pool.get(content_length)
+    nbytes = 0
+    try:
+        async for chunk in request.stream():
+            end = nbytes + len(chunk)
+            if end > content_length:
+                raise HTTPException(
+                    status_code=400,
+                    detail="Request body is larger than its Content-Length"
+                )
+            buffer[nbytes:end] = np.frombuffer(chunk, np.uint8)
+            nbytes = end
+    except BaseException:
+        body_pool.put(buffer)
+        raise
+    if not nbytes:
+        body_pool.put(buffer)
+        return None, 1.0
+    
+    # The decode thread keeps reading the buffer even if this request is
+    # cancelled, so the buffer only returns to the pool once the decode is
+    # done (the decoded image owns its memory)
+    decode = asyncio.get_running_loop().run_in_executor(
+        None, decode_frame, memoryview(buffer[:nbytes])
+    )
+    decode.add_done_callback(lambda _: body_pool.put(buffer))
+    return await asyncio.shield(decode)
+
+
+def is_loopback_client(websocket: WebSocket) -> bool:
+    """Check whether a WebSocket peer is on this host.
+    
+    Args:
+        websocket: Connected WebSocket
+        
+    Returns:
+        True if the peer address is a loopback address
+    """
+    if websocket.client is None:
+        return False
+    try:
+        return ipaddress.ip_address(websocket.client.host).is_loopback
+    except ValueError:
+        return False
+
+
+def read_shared_frame(envelope: Dict) -> np.ndarray:
+    """Copy a frame written to shared memory by a same-host client.
+    
+    The frame is copied out and the block unmapped straight away: the batch
+    queue may still reference the image after its result has been returned,
+    and a block with live views into it cannot be closed.
+    
+    Args:
+        envelope: {"type": "shm", "name": "<block name>", "shape": [h, w, 3]}
+        
+    Returns:
+        Frame as a uint8 array that owns its memory
+    """
+    shape = tuple(int(dim) for dim in envelope["shape"])
+    if len(shape) != 3 or shape[2] != 3:
+        raise ValueError(f"Expected an (h, w, 3) frame, got shape {shape}")
+    
+    block = shared_memory.SharedMemory(name=envelope["name"])
+    if os.name == "posix":
+        # Attaching registers the block with resource_tracker, which would
+        # unlink the client's segment when the server exits
+        resource_tracker.unregister(block._name, "shared_memory")
+    try:
+        view = np.ndarray(shape, dtype=np.uint8, buffer=block.buf)
+        image = np.array(view)
+        del view
+    finally:
+        block.close()
+    return image
 
 
 @app.get("/")
@@ -221,30 +461,28 @@ async def websocket_video(websocket: WebSocket):
     await websocket.accept()
     
     if not orchestrator:
-        await websocket.send_json({
+        await send_message(websocket, {
             "type": "error",
             "message": "Orchestrator not initialized"
         })
         await websocket.close(code=1000, reason="Orchestrator not initialized")
         return
     
-    global frame_counter
-    
     try:
         # Send connection confirmation
-        await websocket.send_json({
+        await send_message(websocket, {
             "type": "connected",
             "message": "WebSocket connection established"
         })
         
         while True:
             # Receive message from client
-            data = await websocket.receive_json()
+            data = loads_json(await websocket.receive_text())
             
             if data.get("type") == "frame":
                 image_data = data.get("image")
                 if not image_data:
-                    await websocket.send_json({
+                    await send_message(websocket, {
                         "type": "error",
                         "message": "No image data provided"
                     })
@@ -252,51 +490,34 @@ async def websocket_video(websocket: WebSocket):
                 
                 try:
                     # Decode base64 image
-                    image = ImageProcessor.decode_base64_image(image_data)
+                    image, scale = await asyncio.to_thread(decode_base64_frame, image_data)
                     
                     if image is None:
-                        await websocket.send_json({
+                        await send_message(websocket, {
                             "type": "error",
                             "message": "Failed to decode image from base64"
                         })
                         continue
                     
-                    # Process image through orchestrator
-                    frame_counter += 1
-                    results = orchestrator.process_image(image, frame_id=frame_counter)
-                    
-                    # Get perception output from results
-                    perception_output = results.get("perception_output")
-                    if perception_output is None:
-                        # Fallback: process again if not in results (shouldn't happen)
-                        perception_output = orchestrator.perception.process_frame(image)
-                    
-                    # Format responses
-                    formatter = ResponseFormatter()
-                    yolo_detections = formatter.format_detections(perception_output)
-                    ocr_text_detections = formatter.format_ocr_results(perception_output)
-                    
-                    response = formatter.format_processing_response(
-                        results, frame_counter, yolo_detections, ocr_text_detections
-                    )
+                    # Process image through orchestrator (batched with other clients)
+                    response = await process_decoded_image(image, scale=scale)
                     
                     # Send results back to client
-                    await websocket.send_json({
+                    await send_message(websocket, {
                         "type": "result",
                         "data": response
                     })
                     
                 except Exception as e:
-                    import traceback
-                    traceback.print_exc()
-                    await websocket.send_json({
+                    report_exception("Processing error", e)
+                    await send_message(websocket, {
                         "type": "error",
                         "message": f"Processing error: {str(e)}"
                     })
             
             elif data.get("type") == "ping":
                 # Respond to ping for connection keepalive
-                await websocket.send_json({
+                await send_message(websocket, {
                     "type": "pong"
                 })
             
@@ -307,10 +528,128 @@ async def websocket_video(websocket: WebSocket):
     except WebSocketDisconnect:
         print("WebSocket client disconnected")
     except Exception as e:
-        import traceback
-        traceback.print_exc()
+        report_exception("WebSocket error", e)
         try:
-            await websocket.send_json({
+            await send_message(websocket, {
+                "type": "error",
+                "message": f"WebSocket error: {str(e)}"
+            })
+        except:
+            pass
+        await websocket.close(code=1011, reason=f"Server error: {str(e)}")
+
+
+@app.websocket("/ws/detect")
+async def websocket_detect(websocket: WebSocket):
+    """WebSocket endpoint for low-overhead frame streaming.
+    
+    Unlike /ws/video, frames are not base64 encoded, which saves the ~33%
+    size overhead and the encode/decode on both ends.
+    Message format:
+    - Client -> Server: binary message with the encoded image (JPEG/PNG bytes)
+    - Client -> Server: {"type": "shm", "name": "<block>", "shape": [h, w, 3]}
+      for same-host clients that write raw BGR frames to shared memory
+      (only with config.allow_shm_frames, and only over loopback)
+    - Client -> Server: {"type": "ping"} / {"type": "close"}
+    - Server -> Client: {"type": "result", "data": {...detection results...}}
+    - Server -> Client: {"type": "error", "message": "..."}
+    
+    A shared memory block must not be overwritten until its result arrives
+    (the server copies the frame out before processing it).
+    
+    Shared memory frames let a client have the server read any named segment
+    on the host. The loopback check cannot tell local clients from remote
+    ones behind a same-host reverse proxy (every proxied client appears as
+    127.0.0.1), so only set allow_shm_frames when no such proxy is in front.
+    """
+    await websocket.accept()
+    
+    if not orchestrator:
+        await send_message(websocket, {
+            "type": "error",
+            "message": "Orchestrator not initialized"
+        })
+        await websocket.close(code=1000, reason="Orchestrator not initialized")
+        return
+    
+    try:
+        await send_message(websocket, {
+            "type": "connected",
+            "message": "WebSocket connection established"
+        })
+        
+        while True:
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                raise WebSocketDisconnect(message.get("code", 1000))
+            
+            try:
+                if message.get("bytes") is not None:
+                    image, scale = await asyncio.to_thread(decode_frame, message["bytes"])
+                    if image is None:
+                        await send_message(websocket, {
+                            "type": "error",
+                            "message": "Failed to decode image bytes"
+                        })
+                        continue
+                    response = await process_decoded_image(image, scale=scale)
+                
+                else:
+                    data = loads_json(message.get("text") or "{}")
+                    
+                    if data.get("type") == "shm":
+                        # Any host segment can be named, so only same-host
+                        # clients may read frames from shared memory
+                        if not config.allow_shm_frames:
+                            await send_message(websocket, {
+                                "type": "error",
+                                "message": "Shared memory frames are disabled"
+                            })
+                            continue
+                        if not is_loopback_client(websocket):
+                            await send_message(websocket, {
+                                "type": "error",
+                                "message": "Shared memory frames are only accepted from same-host clients"
+                            })
+                            continue
+                        image = await asyncio.to_thread(read_shared_frame, data)
+                        # Raw frames are not decoded at reduced scale
+                        response = await process_decoded_image(image, scale=1.0)
+                    
+                    elif data.get("type") == "ping":
+                        await send_message(websocket, {
+                            "type": "pong"
+                        })
+                        continue
+                    
+                    elif data.get("type") == "close":
+                        break
+                    
+                    else:
+                        await send_message(websocket, {
+                            "type": "error",
+                            "message": f"Unknown message type: {data.get('type')}"
+                        })
+                        continue
+                
+                await send_message(websocket, {
+                    "type": "result",
+                    "data": response
+                })
+            
+            except Exception as e:
+                report_exception("Processing error", e)
+                await send_message(websocket, {
+                    "type": "error",
+                    "message": f"Processing error: {str(e)}"
+                })
+    
+    except WebSocketDisconnect:
+        print("WebSocket client disconnected")
+    except Exception as e:
+        report_exception("WebSocket error", e)
+        try:
+            await send_message(websocket, {
                 "type": "error",
                 "message": f"WebSocket error: {str(e)}"
             })
@@ -324,10 +663,10 @@ async def get_detections():
     """Get current detections (for polling) - deprecated.
     
     This endpoint is deprecated since frontend now handles camera input.
-    Use /input-image-base64 to send images and get detections.
+    Use /input-image (raw bytes) to send images and get detections.
     """
     return {
-        "error": "This endpoint is deprecated. Frontend handles camera input. Use /input-image-base64 to send images.",
+        "error": "This endpoint is deprecated. Frontend handles camera input. Use /input-image (raw bytes) to send images.",
         "detections": [],
         "tracks": []
     }
@@ -362,10 +701,9 @@ async def ask_question(question: str):
 async def process_image_base64(request: ImageRequest):
     """Process image received from frontend (base64 encoded).
     
-    This is the main endpoint that receives camera frames from the frontend.
+    Legacy: base64 inflates each frame by 4/3 and adds a decode step;
+    streaming clients should POST raw bytes to /input-image instead.
     """
-    global frame_counter
-    
     if not orchestrator:
         raise HTTPException(
             status_code=503,
@@ -374,7 +712,7 @@ async def process_image_base64(request: ImageRequest):
     
     try:
         # Decode base64 image
-        image = ImageProcessor.decode_base64_image(request.image)
+        image, scale = await asyncio.to_thread(decode_base64_frame, request.image)
         
         if image is None:
             raise HTTPException(
@@ -382,31 +720,48 @@ async def process_image_base64(request: ImageRequest):
                 detail="Failed to decode image from base64"
             )
         
-        # Process image through orchestrator
-        frame_counter += 1
-        results = orchestrator.process_image(image, frame_id=frame_counter)
-        
-        # Get perception output from results
-        perception_output = results.get("perception_output")
-        if perception_output is None:
-            # Fallback: process again if not in results (shouldn't happen)
-            perception_output = orchestrator.perception.process_frame(image)
-        
-        # Format responses
-        formatter = ResponseFormatter()
-        yolo_detections = formatter.format_detections(perception_output)
-        ocr_text_detections = formatter.format_ocr_results(perception_output)
-        
-        return formatter.format_processing_response(
-            results, frame_counter, yolo_detections, ocr_text_detections
+        # Process image through orchestrator (batched with other clients)
+        return json_response(await process_decoded_image(image, scale=scale))
+    
+    except HTTPException:
+        raise
+    except Exception as e:
+        report_exception("Processing error", e)
+        raise HTTPException(
+            status_code=500,
+            detail=f"Processing error: {str(e)}"
+        )
+
+
+@app.post("/input-image")
+async def process_image_bytes(request: Request):
+    """Process a raw encoded image (JPEG/PNG bytes as the request body).
+    
+    Preferred over /input-image-base64: the body is sent as-is
+    (``Content-Type: application/octet-stream``), so there is no base64
+    expansion on the wire and no base64 decode on the server.
+    """
+    if not orchestrator:
+        raise HTTPException(
+            status_code=503,
+            detail="Orchestrator not initialized"
         )
     
+    try:
+        image, scale = await read_image_body(request)
+        if image is None:
+            raise HTTPException(
+                status_code=400,
+                detail="Missing or undecodable image data"
+            )
+        
+        # Process image through orchestrator (batched with other clients)
+        return json_response(await process_decoded_image(image, scale=scale))
+    
     except HTTPException:
         raise
     except Exception as e:
-        error_msg = f"[ERROR] {str(e)}"
-        import traceback
-        traceback.print_exc()
+        report_exception("Processing error", e)
         raise HTTPException(
             status_code=500,
             detail=f"Processing error: {str(e)}"
@@ -415,5 +770,10 @@ async def process_image_base64(request: ImageRequest):
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    uvicorn.run(
+        "app.api:app",
+        host=config.api_host,
+        port=config.api_port,
+        workers=config.api_workers
+    )
 
@@ -13,9 +13,19 @@ class Config:
     frame_width: int = 640
     frame_height: int = 480
     fps: int = 30
+    frame_decode_reduction: int = 1  # 1 (full), 2, 4 or 8; >1 decodes frames at reduced scale
+    frame_decode_max_side: Optional[int] = None  # If set, frames are decoded/resized down to this long side (overrides reduction)
+    max_frame_bytes: int = 16 * 1024 * 1024  # Larger uploads are rejected (HTTP 413) before buffering
+    gpu_jpeg_decode: bool = os.getenv("GPU_JPEG_DECODE", "false").lower() == "true"  # nvJPEG via torchvision
     
     # Model settings
     yolo_model: str = "yolov8n.pt"  # Ultralytics YOLO
+    yolo_imgsz: int = 640  # Fixed (letterboxed) input size; match the exported engine
+    yolo_iou_threshold: float = 0.7  # NMS IoU threshold
+    yolo_max_detections: int = 300  # Max boxes kept after NMS
+    yolo_int8_engine: Optional[str] = os.getenv("YOLO_INT8_ENGINE")  # TensorRT INT8 engine (preferred on CUDA)
+    yolo_fp16_engine: Optional[str] = os.getenv("YOLO_FP16_ENGINE")  # TensorRT FP16 engine (no INT8 support)
+    yolo_openvino_model: Optional[str] = os.getenv("YOLO_OPENVINO_MODEL")  # OpenVINO INT8 model dir (CPU)
     # device: str = "cuda" if os.getenv("CUDA_AVAILABLE", "false").lower() == "true" else "cpu"
     device: str = "cuda" if (os.getenv("CUDA_AVAILABLE", "").lower() != "false" and torch.cuda.is_available()) else "cpu"
         
@@ -28,9 +38,18 @@ class Config:
     ocr_detection_model: str = "easyocr"  # Using EasyOCR (handles both detection and recognition)
     ocr_recognition_model: str = "easyocr"  # Using EasyOCR
     ocr_confidence_threshold: float = 0.5
+    ocr_recognition_batch_size: int = 16  # Text crops recognized per forward pass
+    ocr_contrast_threshold: float = 0.0  # >0 re-recognizes crops below this confidence with boosted contrast
+    ocr_fp16: bool = False  # FP16 OCR networks on CUDA; validate accuracy first, pre-Volta GPUs may be slower
+    ocr_cache_size: int = 0  # >0 caches OCR results by frame content hash; for re-uploaded identical images, not live video
     
     # Depth settings
     midas_model: str = "DPT_Large"  # or "MiDaS_small"
+    midas_quantize: bool = False  # FP16 weights on CUDA, dynamic INT8 Linear layers on CPU; validate accuracy first
+    midas_compile: bool = False  # torch.compile MiDaS + upsample with CUDA graphs (slow first call)
+    
+    # Startup warm-up
+    warmup_runs: int = 3  # Blank-frame passes per model at startup on CUDA (CPU runs at most 1; 0 disables)
     
     # Risk & Prioritization
     max_priority_items: int = 5
@@ -58,6 +77,13 @@ class Config:
     api_host: str = "0.0.0.0"
     api_port: int = 8000
     api_debug: bool = False
+    api_workers: int = int(os.getenv("API_WORKERS", "1"))  # Each worker loads its own copy of the models
+    allow_shm_frames: bool = os.getenv("ALLOW_SHM_FRAMES", "false").lower() == "true"  # /ws/detect shared-memory frames; unsafe behind a same-host proxy
+    opencv_threads: int = int(os.getenv("OPENCV_THREADS", "1"))  # Per-call OpenCV threads; frames are already decoded concurrently
+    
+    # Request batching
+    batch_max_size: int = 4  # Frames per batched forward pass
+    batch_max_wait_ms: float = 10.0  # Max time to wait for a batch to fill
 
 
 config = Config()
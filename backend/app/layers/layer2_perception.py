@@ -1,4 +1,10 @@
 """Layer 2: Perception Models - Fast, frame-level PyTorch-based models."""
+import os
+import hashlib
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 import torch
 import numpy as np
 import cv2
@@ -9,6 +15,8 @@ from app.config import config
 # Constants
 TRACKING_DISTANCE_THRESHOLD = 50  # pixels
 VELOCITY_CALCULATION_WINDOW = 5  # number of trajectory points
+INT8_MIN_COMPUTE_CAPABILITY = (6, 1)  # First CUDA architecture with DP4A INT8
+LETTERBOX_PAD_VALUE = (114, 114, 114)  # Ultralytics' letterbox fill colour
 
 # Object Detection (YOLO)
 try:
@@ -86,6 +94,63 @@ class PerceptionOutput:
     segmentation: Optional[np.ndarray] = None  # Optional segmentation mask
 
 
+class _FrameScratch(threading.local):
+    """Per-thread scratch image reused across frames of the same size."""
+    image: Optional[np.ndarray] = None
+
+
+def _bgr_to_rgb(image: np.ndarray, scratch: _FrameScratch) -> np.ndarray:
+    """Convert BGR to RGB into a reusable buffer.
+    
+    The buffer is only reallocated when the incoming frame shape changes,
+    so a steady camera stream converts without a fresh allocation per frame.
+    
+    Args:
+        image: Input image (BGR format)
+        scratch: Scratch holder owned by the caller
+        
+    Returns:
+        RGB image backed by the scratch buffer
+    """
+    buffer = scratch.image
+    if buffer is None or buffer.shape != image.shape or buffer.dtype != image.dtype:
+        buffer = np.empty_like(image)
+        scratch.image = buffer
+    return cv2.cvtColor(image, cv2.COLOR_BGR2RGB, dst=buffer)
+
+
+def letterbox(image: np.ndarray, size: int) -> Tuple[np.ndarray, float, Tuple[int, int]]:
+    """Resize and pad an image to a fixed square input, keeping aspect ratio.
+    
+    Mirrors Ultralytics' ``LetterBox`` with a fixed output shape, so the model
+    always sees the same input size regardless of the frame's aspect ratio.
+    
+    Args:
+        image: Input image (BGR format)
+        size: Output width and height
+        
+    Returns:
+        (letterboxed image, scale factor, (pad_x, pad_y)) where
+        ``model_xy = image_xy * scale + pad``
+    """
+    height, width = image.shape[:2]
+    scale = min(size / height, size / width)
+    new_width, new_height = round(width * scale), round(height * scale)
+    if (new_width, new_height) != (width, height):
+        image = cv2.resize(image, (new_width, new_height), interpolation=cv2.INTER_LINEAR)
+    
+    pad_x = (size - new_width) // 2
+    pad_y = (size - new_height) // 2
+    padded = cv2.copyMakeBorder(
+        image,
+        pad_y, size - new_height - pad_y,
+        pad_x, size - new_width - pad_x,
+        cv2.BORDER_CONSTANT,
+        value=LETTERBOX_PAD_VALUE
+    )
+    return padded, scale, (pad_x, pad_y)
+
+
 class ObjectDetector:
     """2A: Object Detection using YOLO (PyTorch)."""
     
@@ -94,11 +159,58 @@ class ObjectDetector:
         if not YOLO_AVAILABLE:
             raise ImportError("ultralytics not installed. Install with: pip install ultralytics")
         
-        self.model_name = model_name or config.yolo_model
         self.device = config.device
-        self.model = YOLO(self.model_name)
-        self.model.to(self.device)
-        self.model.fuse()
+        self.model_name = model_name or self._select_model_path()
+        self.iou_threshold = config.yolo_iou_threshold
+        self.max_detections = config.yolo_max_detections
+        self.imgsz = config.yolo_imgsz
+        
+        if self.device == "cuda":
+            # Inputs are letterboxed to one fixed shape, so the autotuned
+            # cuDNN algorithms are picked once and reused for every frame
+            torch.backends.cudnn.benchmark = True
+        
+        if self.model_name.endswith(".pt"):
+            self.model = YOLO(self.model_name)
+            self.model.to(self.device)
+            self.model.fuse()
+            # Run the PyTorch checkpoint in FP16 on CUDA
+            self.half = self.device == "cuda"
+        else:
+            # Exported models are already fused and bound to their runtime,
+            # with their precision fixed at export time
+            self.model = YOLO(self.model_name, task="detect")
+            self.half = False
+        
+        # Bind hot-path handles once instead of resolving them every frame
+        self._predict = self.model.predict
+        # model.names is a dict keyed by class id; keep an object array instead
+        # so a whole frame's labels are gathered with one fancy-index
+        names = self.model.names
+        self._names = np.array([names[i] for i in range(len(names))], dtype=object)
+    
+    def _select_model_path(self) -> str:
+        """Pick the fastest available YOLO weights for this device.
+        
+        Prefers a TensorRT INT8 engine on GPUs with INT8 support, then an
+        FP16 engine; on CPU prefers an OpenVINO INT8 model. Falls back to the
+        PyTorch checkpoint.
+        
+        Returns:
+            Path to the model to load
+        """
+        candidates = []
+        if self.device == "cuda":
+            if torch.cuda.get_device_capability() >= INT8_MIN_COMPUTE_CAPABILITY:
+                candidates.append(config.yolo_int8_engine)
+            candidates.append(config.yolo_fp16_engine)
+        else:
+            candidates.append(config.yolo_openvino_model)
+        
+        for path in candidates:
+            if path and os.path.exists(path):
+                return path
+        return config.yolo_model
     
     def detect(self, image: np.ndarray) -> List[Detection]:
         """Run object detection.
@@ -109,25 +221,57 @@ class ObjectDetector:
         Returns:
             List of detections
         """
-        results = self.model(image, verbose=False)
-        detections = []
-        
-        for result in results:
-            boxes = result.boxes
-            for i in range(len(boxes)):
-                box = boxes.xyxy[i].cpu().numpy()
-                conf = float(boxes.conf[i].cpu().numpy())
-                cls_id = int(boxes.cls[i].cpu().numpy())
-                cls_name = self.model.names[cls_id]
-                
+        return self.detect_batch([image])[0]
+    
+    def detect_batch(self, images: List[np.ndarray]) -> List[List[Detection]]:
+        """Run object detection on several images in one forward pass.
+        
+        Args:
+            images: Input images (BGR format)
+            
+        Returns:
+            List of detections for each image, in input order
+        """
+        # Letterbox once on the CPU; the predictor's own letterbox is then a
+        # no-op because the frames already match imgsz
+        letterboxed = [letterbox(image, self.imgsz) for image in images]
+        
+        # Class-aware NMS runs on the model device inside the predictor
+        results = self._predict(
+            [padded for padded, _, _ in letterboxed],
+            verbose=False,
+            imgsz=self.imgsz,
+            half=self.half,
+            augment=False,
+            iou=self.iou_threshold,
+            max_det=self.max_detections,
+            agnostic_nms=False
+        )
+        batch_detections = []
+        
+        for result, image, (_, scale, (pad_x, pad_y)) in zip(results, images, letterboxed):
+            detections = []
+            # Read back only the surviving boxes in a single device->host copy
+            # Rows are [x1, y1, x2, y2, confidence, class_id]
+            data = result.boxes.data[:, :6].cpu().numpy()
+            class_ids = data[:, 5].astype(np.intp)
+            class_names = self._names[class_ids].tolist()
+            # Map boxes from letterboxed input back to frame coordinates; the
+            # predictor only clips to the padded canvas, so clip to the frame
+            height, width = image.shape[:2]
+            boxes = (data[:, :4] - (pad_x, pad_y, pad_x, pad_y)) / scale
+            np.clip(boxes, 0, (width, height, width, height), out=boxes)
+            rows = zip(boxes.tolist(), data[:, 4].tolist(), class_ids.tolist(), class_names)
+            for bbox, conf, cls_id, class_name in rows:
                 detections.append(Detection(
-                    bbox=(float(box[0]), float(box[1]), float(box[2]), float(box[3])),
+                    bbox=tuple(bbox),
                     confidence=conf,
                     class_id=cls_id,
-                    class_name=cls_name
+                    class_name=class_name
                 ))
+            batch_detections.append(detections)
         
-        return detections
+        return batch_detections
 
 
 class MultiObjectTracker:
@@ -235,19 +379,48 @@ class MultiObjectTracker:
         
         # Calculate velocities
         for track in self.tracks.values():
-            if len(track.trajectory) >= 2:
-                recent = track.trajectory[-VELOCITY_CALCULATION_WINDOW:]
-                if len(recent) >= 2:
-                    dx = recent[-1][0] - recent[0][0]
-                    dy = recent[-1][1] - recent[0][1]
-                    dt = len(recent) - 1
-                    track.velocity = (dx / dt, dy / dt) if dt > 0 else (0, 0)
+            # Only the window's first and last points are needed; index them
+            # directly instead of slicing a copy of the trajectory tail
+            window = min(len(track.trajectory), VELOCITY_CALCULATION_WINDOW)
+            if window >= 2:
+                first_x, first_y = track.trajectory[-window]
+                last_x, last_y = track.trajectory[-1]
+                dt = window - 1
+                track.velocity = ((last_x - first_x) / dt, (last_y - first_y) / dt)
         
         # Return active tracks
         active_tracks = [t for t in self.tracks.values() if t.age == 0]
         return active_tracks
 
 
+class _HalfPrecision(torch.nn.Module):
+    """Run a wrapped network in FP16 behind an FP32 interface.
+    
+    Floating-point inputs are cast to FP16 on the way in and outputs back to
+    FP32 on the way out, so callers' post-processing (NumPy/OpenCV) is
+    unaffected.
+    """
+    
+    def __init__(self, module: torch.nn.Module):
+        """Wrap a network, converting its weights to FP16."""
+        super().__init__()
+        self.module = module.half()
+    
+    def forward(self, *args):
+        """Forward with FP16 inputs, returning FP32 outputs."""
+        args = tuple(
+            arg.half() if torch.is_tensor(arg) and arg.is_floating_point() else arg
+            for arg in args
+        )
+        outputs = self.module(*args)
+        if isinstance(outputs, tuple):
+            return tuple(
+                output.float() if torch.is_tensor(output) and output.is_floating_point() else output
+                for output in outputs
+            )
+        return outputs.float()
+
+
 class TextUnderstanding:
     """2C: Text understanding using EasyOCR (PyTorch-based)."""
     
@@ -255,6 +428,12 @@ class TextUnderstanding:
         """Initialize EasyOCR pipeline."""
         self.device = config.device
         self.confidence_threshold = config.ocr_confidence_threshold
+        self.recognition_batch_size = config.ocr_recognition_batch_size
+        self.contrast_threshold = config.ocr_contrast_threshold
+        self._rgb_scratch = _FrameScratch()
+        # LRU of frame content digest -> text regions (OCR is stateless)
+        self.cache_size = config.ocr_cache_size
+        self._cache: "OrderedDict[bytes, List[TextRegion]]" = OrderedDict()
         
         try:
             import easyocr
@@ -263,7 +442,21 @@ class TextUnderstanding:
             # gpu=True uses GPU if available, False uses CPU
             use_gpu = (self.device == "cuda")
             print(f"Using GPU: {use_gpu}")
-            self.reader = easyocr.Reader(['en'], gpu=use_gpu, verbose=False)
+            # On CUDA let cuDNN autotune the detector/recognizer convolutions
+            # once (frames share one size); on CPU keep EasyOCR's dynamic
+            # INT8 quantization of the networks
+            self.reader = easyocr.Reader(
+                ['en'],
+                gpu=use_gpu,
+                verbose=False,
+                quantize=True,
+                cudnn_benchmark=use_gpu
+            )
+            if use_gpu and config.ocr_fp16:
+                # Halves activation traffic and uses tensor cores for the
+                # CRAFT detector and CRNN recognizer
+                self.reader.detector = _HalfPrecision(self.reader.detector)
+                self.reader.recognizer = _HalfPrecision(self.reader.recognizer)
             print("EasyOCR initialized successfully.")
         except ImportError:
             raise ImportError(
@@ -285,43 +478,175 @@ class TextUnderstanding:
         if self.reader is None:
             return []
         
-        try:
-            # EasyOCR expects RGB, but we have BGR from OpenCV
-            image_rgb = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
-            
-            # Run OCR
-            # Returns: [([[x1,y1], [x2,y2], [x3,y3], [x4,y4]], 'text', confidence), ...]
-            results = self.reader.readtext(image_rgb)
+        # EasyOCR expects RGB, but we have BGR from OpenCV
+        return self.extract_text_rgb(_bgr_to_rgb(image, self._rgb_scratch))
+    
+    def extract_text_rgb(self, image_rgb: np.ndarray) -> List[TextRegion]:
+        """Extract text from an image already converted to RGB.
+        
+        Args:
+            image_rgb: Input image (RGB format)
             
-            text_regions = []
-            for detection in results:
-                # detection format: (bbox, text, confidence)
-                bbox_points, text, confidence = detection
-                
-                # Filter by confidence threshold
-                if confidence < self.confidence_threshold:
-                    continue
-                
-                # Convert bbox points to (x1, y1, x2, y2) format
-                # bbox_points is [[x1,y1], [x2,y2], [x3,y3], [x4,y4]]
-                x_coords = [point[0] for point in bbox_points]
-                y_coords = [point[1] for point in bbox_points]
-                x1 = min(x_coords)
-                y1 = min(y_coords)
-                x2 = max(x_coords)
-                y2 = max(y_coords)
-                
-                text_regions.append(TextRegion(
-                    bbox=(float(x1), float(y1), float(x2), float(y2)),
-                    text=text,
-                    confidence=float(confidence)
-                ))
+        Returns:
+            List of text regions
+        """
+        return self.extract_text_batch_rgb([image_rgb])[0]
+    
+    def extract_text_batch_rgb(self, images_rgb: List[np.ndarray]) -> List[List[TextRegion]]:
+        """Extract text from several RGB images.
+        
+        Frames of the same size go through EasyOCR's batched API, which runs
+        the text detector over the whole stack in one forward pass; mixed
+        sizes fall back to one call per frame.
+        
+        Args:
+            images_rgb: Input images (RGB format)
             
-            return text_regions
+        Returns:
+            List of text regions for each image, in input order
+        """
+        if self.reader is None:
+            return [[] for _ in images_rgb]
+        
+        if not self.cache_size:
+            return self._run_ocr(images_rgb)
+        
+        # Identical frames (static scene, re-sent image) skip OCR entirely
+        keys = [self._content_key(image_rgb) for image_rgb in images_rgb]
+        outputs: List[Optional[List[TextRegion]]] = []
+        for key in keys:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                cached = list(cached)
+            outputs.append(cached)
         
+        missing = [i for i, output in enumerate(outputs) if output is None]
+        if missing:
+            results = self._run_ocr([images_rgb[i] for i in missing])
+            for i, text_regions in zip(missing, results):
+                outputs[i] = text_regions
+                self._cache[keys[i]] = list(text_regions)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        
+        return outputs
+    
+    @staticmethod
+    def _content_key(image: np.ndarray) -> bytes:
+        """Digest of a frame's pixels and shape, used as the cache key."""
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(str(image.shape).encode())
+        digest.update(np.ascontiguousarray(image).data)
+        return digest.digest()
+    
+    def _run_ocr(self, images_rgb: List[np.ndarray]) -> List[List[TextRegion]]:
+        """Run EasyOCR on several RGB images (see extract_text_batch_rgb).
+        
+        Args:
+            images_rgb: Input images (RGB format)
+            
+        Returns:
+            List of text regions for each image, in input order
+        """
+        try:
+            # Recognize all detected crops in batched forward passes (EasyOCR
+            # defaults to one crop per forward). The low-contrast second
+            # recognition pass is skipped unless contrast_threshold > 0.
+            # Each result: [([[x1,y1], [x2,y2], [x3,y3], [x4,y4]], 'text', confidence), ...]
+            same_size = all(image.shape == images_rgb[0].shape for image in images_rgb)
+            if len(images_rgb) > 1 and same_size:
+                batch_results = self.reader.readtext_batched(
+                    images_rgb,
+                    batch_size=self.recognition_batch_size,
+                    contrast_ths=self.contrast_threshold
+                )
+            else:
+                batch_results = [
+                    self.reader.readtext(
+                        image_rgb,
+                        batch_size=self.recognition_batch_size,
+                        contrast_ths=self.contrast_threshold
+                    )
+                    for image_rgb in images_rgb
+                ]
         except Exception as e:
             print(f"Error in OCR extraction: {e}")
+            return [[] for _ in images_rgb]
+        
+        return [self._to_text_regions(results) for results in batch_results]
+    
+    def _to_text_regions(self, results: List) -> List[TextRegion]:
+        """Filter one image's EasyOCR results and convert them to text regions.
+        
+        Args:
+            results: EasyOCR detections as (quad, text, confidence) tuples
+            
+        Returns:
+            List of text regions above the confidence threshold
+        """
+        # Filter by confidence threshold, collecting quads and texts in the
+        # same pass instead of walking the kept detections again
+        quads = []
+        texts = []
+        confidences = []
+        for quad, text, confidence in results:
+            if confidence >= self.confidence_threshold:
+                quads.append(quad)
+                texts.append(text)
+                confidences.append(confidence)
+        if not quads:
             return []
+        
+        # Convert all quads to (x1, y1, x2, y2) in one pass
+        # Stacked shape is (K, 4, 2): K boxes of [[x1,y1], [x2,y2], [x3,y3], [x4,y4]]
+        quads = np.asarray(quads, dtype=np.float64)
+        corners = np.concatenate((quads.min(axis=1), quads.max(axis=1)), axis=1).tolist()
+        # Unbox NumPy scalar confidences to Python floats in one call
+        confidences = np.asarray(confidences, dtype=np.float64).tolist()
+        
+        return [
+            TextRegion(
+                bbox=tuple(bbox),
+                text=text,
+                confidence=confidence
+            )
+            for bbox, text, confidence in zip(corners, texts, confidences)
+        ]
+
+
+@lru_cache(maxsize=None)
+def _load_midas_transforms():
+    """Load the MiDaS transforms module from torch.hub once per process."""
+    return torch.hub.load("intel-isl/MiDaS", "transforms")
+
+
+class _MidasWithUpsample(torch.nn.Module):
+    """MiDaS forward plus the bicubic upsample to frame size as one module.
+    
+    Keeping both in one graph lets torch.compile fuse the output cast into
+    the upsample and capture the whole pass in a CUDA graph.
+    """
+    
+    def __init__(self, midas: torch.nn.Module):
+        """Wrap a loaded MiDaS model."""
+        super().__init__()
+        self.midas = midas
+    
+    def forward(self, x: torch.Tensor, height: int, width: int) -> torch.Tensor:
+        """Predict depth for a batch and resize it to (height, width).
+        
+        Returns:
+            FP32 tensor of shape (batch, height, width)
+        """
+        # Upsample in FP32 so the depth map precision matches the CPU path
+        prediction = self.midas(x).float()
+        return torch.nn.functional.interpolate(
+            prediction.unsqueeze(1),
+            size=(height, width),
+            mode="bicubic",
+            align_corners=False
+        ).squeeze(1)
 
 
 class DepthEstimator:
@@ -333,6 +658,9 @@ class DepthEstimator:
         self.device = config.device
         self.model = None
         self.transform = None
+        self._forward = None
+        self._input_dtype = torch.float32
+        self._rgb_scratch = _FrameScratch()
         self._load_model()
     
     def _load_model(self):
@@ -342,9 +670,17 @@ class DepthEstimator:
             self.model = torch.hub.load("intel-isl/MiDaS", self.model_name)
             self.model.to(self.device)
             self.model.eval()
+            if config.midas_quantize:
+                self._quantize_model()
             
-            # Get transform
-            midas_transforms = torch.hub.load("intel-isl/MiDaS", "transforms")
+            module = _MidasWithUpsample(self.model)
+            if config.midas_compile and self.device == "cuda" and hasattr(torch, "compile"):
+                # CUDA graphs cut the launch overhead that dominates MiDaS_small
+                module = torch.compile(module, mode="reduce-overhead")
+            self._forward = module
+            
+            # Get transform (the hub module is shared by all estimators)
+            midas_transforms = _load_midas_transforms()
             if self.model_name == "DPT_Large" or self.model_name == "DPT_Hybrid":
                 self.transform = midas_transforms.dpt_transform
             else:
@@ -353,6 +689,22 @@ class DepthEstimator:
             print(f"Warning: Could not load MiDaS model: {e}")
             print("Install with: pip install torch torchvision")
             self.model = None
+            self._forward = None
+    
+    def _quantize_model(self):
+        """Reduce MiDaS precision for the current device.
+        
+        On CUDA the weights are cast to FP16 (half the memory traffic, tensor
+        cores on the DPT transformer blocks). On CPU the Linear layers are
+        dynamically quantized to INT8.
+        """
+        if self.device == "cuda":
+            self.model.half()
+            self._input_dtype = torch.float16
+        else:
+            self.model = torch.quantization.quantize_dynamic(
+                self.model, {torch.nn.Linear}, dtype=torch.qint8
+            )
     
     def estimate_depth(self, image: np.ndarray) -> Optional[DepthMap]:
         """Estimate depth map.
@@ -363,35 +715,65 @@ class DepthEstimator:
         Returns:
             DepthMap or None if model not available
         """
-        if self.model is None:
+        if self._forward is None:
             return None
         
         # Convert BGR to RGB
-        img_rgb = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
+        return self.estimate_depth_rgb(_bgr_to_rgb(image, self._rgb_scratch))
+    
+    def estimate_depth_rgb(self, img_rgb: np.ndarray) -> Optional[DepthMap]:
+        """Estimate depth map for an image already converted to RGB.
+        
+        Args:
+            img_rgb: Input image (RGB format)
+            
+        Returns:
+            DepthMap or None if model not available
+        """
+        return self.estimate_depth_batch_rgb([img_rgb])[0]
+    
+    def estimate_depth_batch_rgb(self, images_rgb: List[np.ndarray]) -> List[Optional[DepthMap]]:
+        """Estimate depth maps for several RGB images.
+        
+        Frames of the same size share a single forward pass; mixed sizes
+        fall back to one pass per frame.
         
-        # Apply transform
-        input_batch = self.transform(img_rgb).to(self.device)
+        Args:
+            images_rgb: Input images (RGB format)
+            
+        Returns:
+            DepthMap (or None if model not available) for each image, in order
+        """
+        if self._forward is None:
+            return [None] * len(images_rgb)
+        
+        height, width = images_rgb[0].shape[:2]
+        if any(image.shape[:2] != (height, width) for image in images_rgb):
+            return [self.estimate_depth_batch_rgb([image])[0] for image in images_rgb]
+        
+        # Apply transform; each call yields a (1, 3, H, W) tensor
+        input_batch = torch.cat([self.transform(image) for image in images_rgb])
+        input_batch = input_batch.to(self.device, dtype=self._input_dtype)
         
         # Run inference
         with torch.no_grad():
-            prediction = self.model(input_batch)
-            prediction = torch.nn.functional.interpolate(
-                prediction.unsqueeze(1),
-                size=img_rgb.shape[:2],
-                mode="bicubic",
-                align_corners=False
-            ).squeeze()
+            prediction = self._forward(input_batch, height, width)
         
         # Convert to numpy
         depth = prediction.cpu().numpy()
         
-        # Normalize to 0-1
-        depth_normalized = (depth - depth.min()) / (depth.max() - depth.min() + 1e-8)
+        # Normalize each frame to 0-1
+        depth_min = depth.min(axis=(1, 2), keepdims=True)
+        depth_max = depth.max(axis=(1, 2), keepdims=True)
+        depth_normalized = (depth - depth_min) / (depth_max - depth_min + 1e-8)
         
-        return DepthMap(
-            depth_map=depth,
-            relative_depth=depth_normalized
-        )
+        return [
+            DepthMap(
+                depth_map=depth[i],
+                relative_depth=depth_normalized[i]
+            )
+            for i in range(len(images_rgb))
+        ]
 
 
 class PerceptionModels:
@@ -399,10 +781,25 @@ class PerceptionModels:
     
     def __init__(self):
         """Initialize all perception models."""
-        self.detector = ObjectDetector() if YOLO_AVAILABLE else None
-        self.tracker = MultiObjectTracker() if TRACKING_AVAILABLE else None
-        self.ocr = TextUnderstanding() if OCR_AVAILABLE else None
-        self.depth_estimator = DepthEstimator() if MIDAS_AVAILABLE else None
+        # Load the models concurrently: cold start is dominated by weight
+        # downloads and file I/O, so it takes the slowest load, not the sum
+        with ThreadPoolExecutor(max_workers=3, thread_name_prefix="model-load") as loader:
+            detector_future = loader.submit(ObjectDetector) if YOLO_AVAILABLE else None
+            ocr_future = loader.submit(TextUnderstanding) if OCR_AVAILABLE else None
+            depth_future = loader.submit(DepthEstimator) if MIDAS_AVAILABLE else None
+            self.tracker = MultiObjectTracker() if TRACKING_AVAILABLE else None
+            
+            self.detector = detector_future.result() if detector_future else None
+            self.ocr = ocr_future.result() if ocr_future else None
+            self.depth_estimator = depth_future.result() if depth_future else None
+        
+        # One worker per independent model: OCR and depth overlap with
+        # detection, while each model still sees one frame at a time
+        self._ocr_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ocr")
+        self._depth_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="depth")
+        
+        # One reusable RGB buffer per batch slot, shared by OCR and depth
+        self._rgb_scratch: List[_FrameScratch] = []
     
     def process_frame(self, image: np.ndarray) -> PerceptionOutput:
         """Process a single frame through all perception models.
@@ -413,30 +810,97 @@ class PerceptionModels:
         Returns:
             PerceptionOutput with all model results
         """
-        # Object detection
-        detections = []
-        if self.detector:
-            detections = self.detector.detect(image)
+        return self.process_batch([image])[0]
+    
+    def process_batch(self, images: List[np.ndarray]) -> List[PerceptionOutput]:
+        """Process several frames, batching object detection across them.
+        
+        OCR and depth have no dependency on detection, so they are submitted
+        to their own workers first and run while detection and tracking
+        proceed on the calling thread. Detection runs as a single forward
+        pass; tracking runs per frame in input order so track state stays
+        consistent.
         
-        # Multi-object tracking
-        tracks = []
-        if self.tracker and detections:
-            tracks = self.tracker.update(detections)
+        Args:
+            images: Input images (BGR format)
+            
+        Returns:
+            PerceptionOutput for each image, in input order
+        """
+        # OCR and depth both consume RGB, so convert each frame once for both
+        rgb_images = []
+        if self.ocr or self.depth_estimator:
+            while len(self._rgb_scratch) < len(images):
+                self._rgb_scratch.append(_FrameScratch())
+            rgb_images = [
+                _bgr_to_rgb(image, scratch)
+                for image, scratch in zip(images, self._rgb_scratch)
+            ]
         
-        # Text understanding
-        text_regions = []
+        # Text understanding (one batched call for the whole batch)
+        ocr_future = None
         if self.ocr:
-            text_regions = self.ocr.extract_text(image)
+            ocr_future = self._ocr_executor.submit(self.ocr.extract_text_batch_rgb, rgb_images)
         
-        # Depth estimation
-        depth = None
+        # Depth estimation (one forward pass for the whole batch)
+        depth_future = None
         if self.depth_estimator:
-            depth = self.depth_estimator.estimate_depth(image)
+            depth_future = self._depth_executor.submit(
+                self.depth_estimator.estimate_depth_batch_rgb, rgb_images
+            )
         
-        return PerceptionOutput(
-            detections=detections,
-            tracks=tracks,
-            text_regions=text_regions,
-            depth=depth
-        )
-
+        # Object detection
+        if self.detector:
+            batch_detections = self.detector.detect_batch(images)
+        else:
+            batch_detections = [[] for _ in images]
+        
+        text_regions = ocr_future.result() if ocr_future else [[] for _ in images]
+        depth_maps = depth_future.result() if depth_future else [None] * len(images)
+        
+        outputs = []
+        for i, detections in enumerate(batch_detections):
+            # Multi-object tracking
+            tracks = []
+            if self.tracker and detections:
+                tracks = self.tracker.update(detections)
+            
+            outputs.append(PerceptionOutput(
+                detections=detections,
+                tracks=tracks,
+                text_regions=text_regions[i],
+                depth=depth_maps[i]
+            ))
+        
+        return outputs
+    
+    def warmup(self, height: int, width: int, runs: Optional[int] = None):
+        """Run blank frames through every model before serving real ones.
+        
+        The first forward passes pay for CUDA context setup and cuDNN/cuBLAS
+        algorithm selection; doing that here keeps it off the first request.
+        On CPU there is nothing to autotune, so at most one pass is run.
+        
+        Args:
+            height: Frame height to warm up for
+            width: Frame width to warm up for
+            runs: Number of warm-up passes (default: config.warmup_runs; 0 disables)
+        """
+        if runs is None:
+            runs = config.warmup_runs
+        if config.device != "cuda":
+            runs = min(runs, 1)
+        
+        blank = np.zeros((height, width, 3), dtype=np.uint8)
+        for _ in range(runs):
+            self.process_batch([blank])
+        
+        # Autotuned kernels are picked per batch size; one full request
+        # batch is enough to cover that shape too
+        if runs > 0 and config.device == "cuda" and config.batch_max_size > 1:
+            self.process_batch([blank] * config.batch_max_size)
+    
+    def shutdown(self):
+        """Stop the OCR and depth workers."""
+        self._ocr_executor.shutdown(wait=True)
+        self._depth_executor.shutdown(wait=True)
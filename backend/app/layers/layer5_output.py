@@ -8,6 +8,9 @@ from app.config import config
 from app.layers.layer4_memory import GatedEvent
 from app.layers.layer3_reasoning import LLMResponse
 
+# Constants
+MAX_PENDING_MESSAGES = 1  # Latest/most urgent message wins; stale speech is dropped
+
 
 class Priority(Enum):
     """Message priority levels."""
@@ -42,8 +45,9 @@ class OutputInteraction:
         self.tts_rate = config.tts_rate
         self.tts_volume = config.tts_volume
         
-        # Priority queue for messages
-        self.message_queue = queue.PriorityQueue()
+        # Bounded priority queue for messages so speech never lags the camera
+        self.message_queue = queue.PriorityQueue(maxsize=MAX_PENDING_MESSAGES)
+        self._queue_lock = threading.Lock()
         self._message_counter = 0
         self.current_message: Optional[SpeechMessage] = None
         self.is_speaking = False
@@ -98,13 +102,41 @@ class OutputInteraction:
         
         # Add to priority queue (lower priority number = higher priority)
         # Use counter as tie-breaker to ensure messages are always comparable
-        self.message_queue.put((priority.value, self._message_counter, message))
+        self._enqueue((priority.value, self._message_counter, message))
         self._message_counter += 1
         
         # If urgent and interruptible, stop current speech
         if priority == Priority.URGENT and interruptible and self.is_speaking:
             self.stop_speaking.set()
     
+    def _enqueue(self, item: tuple):
+        """Queue a message without blocking the caller.
+        
+        When the queue is full the pending message is replaced unless it is
+        more urgent than the new one, so the worker always speaks the most
+        relevant recent message instead of working through a backlog.
+        
+        Args:
+            item: (priority value, counter, SpeechMessage) tuple
+        """
+        with self._queue_lock:
+            try:
+                self.message_queue.put_nowait(item)
+                return
+            except queue.Full:
+                pass
+            
+            try:
+                pending = self.message_queue.get_nowait()
+                self.message_queue.task_done()
+            except queue.Empty:
+                pending = None
+            
+            # Keep the pending message if it is strictly more urgent
+            if pending is not None and pending[0] < item[0]:
+                item = pending
+            self.message_queue.put_nowait(item)
+    
     def speak_gated_event(self, gated_event: GatedEvent, llm_response: Optional[LLMResponse] = None):
         """Speak a gated event with optional LLM-generated description.
         
@@ -1,6 +1,6 @@
 """Main orchestrator that coordinates all layers."""
 import time
-from typing import Optional, Dict, List
+from typing import Optional, Dict, List, Tuple
 import numpy as np
 from app.config import config
 from app.layers.layer1_sensor import SensorIngest, Frame
@@ -40,6 +40,9 @@ class SmartGlassesOrchestrator:
         
         self.is_running = False
         self.frame_count = 0
+        
+        # Resolved once; config is not reloaded at runtime
+        self._description_mode = "navigation" if config.navigation_mode else "description"
     
     def start(self):
         """Start the system (without camera - camera handled by frontend)."""
@@ -48,6 +51,11 @@ class SmartGlassesOrchestrator:
         # Don't start camera - frontend handles camera input
         # Sensor will be used only for processing frames received from frontend
         
+        # Warm up models so the first frame doesn't pay one-time setup costs
+        if config.warmup_runs > 0:
+            print("Warming up perception models...")
+            self.perception.warmup(config.frame_height, config.frame_width)
+        
         # Start output
         self.output.start()
         
@@ -66,6 +74,9 @@ class SmartGlassesOrchestrator:
         # Stop output
         self.output.stop()
         
+        # Stop perception workers
+        self.perception.shutdown()
+        
         print("System stopped.")
     
     def _process_perception(self, image: np.ndarray) -> PerceptionOutput:
@@ -116,10 +127,9 @@ class SmartGlassesOrchestrator:
         
         llm_response = None
         if generate_llm:
-            mode_str = "navigation" if config.navigation_mode else "description"
             llm_response = self.scene_reasoning.generate_description(
                 scene_graph,
-                mode=mode_str
+                mode=self._description_mode
             )
         
         return scene_graph, llm_response
@@ -128,7 +138,7 @@ class SmartGlassesOrchestrator:
         self, 
         risk_events: List, 
         llm_response: Optional = None
-    ) -> List:
+    ) -> tuple:
         """Process event gating and output.
         
         Args:
@@ -136,23 +146,25 @@ class SmartGlassesOrchestrator:
             llm_response: Optional LLM response
             
         Returns:
-            List of gated events
+            Tuple of (gated_events, number of events spoken)
         """
         gated_events = self.memory_gating.gate_events(risk_events)
         
-        # Output gated events
+        # Output gated events, counting them in the same pass
+        gated_count = 0
         for gated_event in gated_events:
             if gated_event.should_speak:
                 self.output.speak_gated_event(gated_event, llm_response)
+                gated_count += 1
         
-        return gated_events
+        return gated_events, gated_count
     
     def _build_results_dict(
         self,
         frame: Frame,
         perception_output: PerceptionOutput,
         risk_events: List,
-        gated_events: List,
+        gated_count: int,
         processing_time: float,
         logs: Optional[List[str]] = None
     ) -> Dict:
@@ -162,14 +174,13 @@ class SmartGlassesOrchestrator:
             frame: Processed frame
             perception_output: Perception results
             risk_events: Risk events
-            gated_events: Gated events
+            gated_count: Number of gated events to speak
             processing_time: Total processing time
             logs: Optional list of log messages
             
         Returns:
             Results dictionary
         """
-        gated_count = len([e for e in gated_events if e.should_speak])
         results = {
             "frame_id": frame.frame_id,
             "timestamp": frame.timestamp,
@@ -212,12 +223,12 @@ class SmartGlassesOrchestrator:
             generate_llm=should_generate_llm
         )
         
-        gated_events = self._process_gating_and_output(risk_events, llm_response)
+        _, gated_count = self._process_gating_and_output(risk_events, llm_response)
         
         processing_time = time.time() - start_time
         
         return self._build_results_dict(
-            frame, perception_output, risk_events, gated_events, processing_time
+            frame, perception_output, risk_events, gated_count, processing_time
         )
     
     def run(self):
@@ -290,11 +301,55 @@ class SmartGlassesOrchestrator:
             image: Input image (BGR format numpy array)
             frame_id: Optional frame ID
             
+        Returns:
+            Processing results dictionary with logs
+        """
+        return self.process_image_batch([(image, frame_id)])[0]
+    
+    def process_image_batch(self, items: List[Tuple[np.ndarray, int]]) -> List[Dict]:
+        """Process several images received from frontend.
+        
+        Perception runs once for the whole batch so object detection shares a
+        single forward pass; the remaining layers run per frame in order.
+        
+        Args:
+            items: List of (image, frame_id) tuples
+            
+        Returns:
+            Processing results dictionary with logs for each item, in order
+        """
+        images = [image for image, _ in items]
+        
+        perception_start = time.time()
+        perception_outputs = self.perception.process_batch(images)
+        # Attribute an equal share of the batched perception time to each frame
+        perception_time = (time.time() - perception_start) / len(items)
+        
+        return [
+            self._process_perceived_image(image, frame_id, perception_output, perception_time)
+            for (image, frame_id), perception_output in zip(items, perception_outputs)
+        ]
+    
+    def _process_perceived_image(
+        self,
+        image: np.ndarray,
+        frame_id: int,
+        perception_output: PerceptionOutput,
+        perception_time: float
+    ) -> Dict:
+        """Run the post-perception layers for one image.
+        
+        Args:
+            image: Input image (BGR format numpy array)
+            frame_id: Frame ID
+            perception_output: Perception results for this image
+            perception_time: Time spent in perception for this image
+            
         Returns:
             Processing results dictionary with logs
         """
         logs: List[str] = []
-        start_time = time.time()
+        start_time = time.time() - perception_time
         
         # Increment frame count
         self.frame_count += 1
@@ -307,10 +362,7 @@ class SmartGlassesOrchestrator:
             f"(size: {image.shape[1]}x{image.shape[0]})"
         )
         
-        # Process through all layers with timing
-        perception_start = time.time()
-        perception_output = self._process_perception(frame.image)
-        perception_time = time.time() - perception_start
+        # Process through remaining layers with timing
         logs.append(
             f"[{time.time():.3f}] Perception: {len(perception_output.detections)} objects, "
             f"{len(perception_output.text_regions)} text regions "
@@ -345,9 +397,8 @@ class SmartGlassesOrchestrator:
             )
         
         gating_start = time.time()
-        gated_events = self._process_gating_and_output(risk_events, llm_response)
+        _, gated_count = self._process_gating_and_output(risk_events, llm_response)
         gating_time = time.time() - gating_start
-        gated_count = len([e for e in gated_events if e.should_speak])
         if gated_count > 0:
             logs.append(
                 f"[{time.time():.3f}] Gating: {gated_count} events to speak "
@@ -358,7 +409,7 @@ class SmartGlassesOrchestrator:
         
         # Build results with logs
         results = self._build_results_dict(
-            frame, perception_output, risk_events, gated_events, 
+            frame, perception_output, risk_events, gated_count, 
             processing_time, logs=logs
         )
         
@@ -0,0 +1,20 @@
+"""Request pipeline utilities shared by the API endpoints."""
+from .batch_queue import AsyncBatchQueue
+from .buffer_pool import BufferPool
+from .decode import (
+    decode_and_resize_from_bytes,
+    decode_base64_frame,
+    decode_frame,
+    decode_image_from_bytes,
+    decode_image_header_from_bytes,
+)
+
+__all__ = [
+    "AsyncBatchQueue",
+    "BufferPool",
+    "decode_and_resize_from_bytes",
+    "decode_base64_frame",
+    "decode_frame",
+    "decode_image_from_bytes",
+    "decode_image_header_from_bytes",
+]
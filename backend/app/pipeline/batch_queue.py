@@ -0,0 +1,108 @@
+"""Async request-aggregation queue for batched model inference."""
+import asyncio
+from concurrent.futures import Executor
+from typing import Any, Callable, List, Optional, Tuple
+
+
+class AsyncBatchQueue:
+    """Collects requests from concurrent callers and processes them in batches.
+    
+    A batch is dispatched as soon as it holds ``max_batch_size`` items or
+    ``max_wait_ms`` has passed since its first item arrived, whichever comes
+    first. The batch function runs in an executor so the event loop stays
+    responsive while the model forward pass is in progress.
+    """
+    
+    def __init__(
+        self,
+        batch_fn: Callable[[List[Any]], List[Any]],
+        max_batch_size: int,
+        max_wait_ms: float,
+        executor: Optional[Executor] = None
+    ):
+        """Initialize batch queue.
+        
+        Args:
+            batch_fn: Function mapping a list of items to a list of results
+            max_batch_size: Maximum number of items per batch
+            max_wait_ms: Maximum time to wait for a batch to fill (milliseconds)
+            executor: Executor for batch_fn (default: loop's default executor)
+        """
+        self.batch_fn = batch_fn
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000.0
+        self.executor = executor
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+    
+    def start(self):
+        """Start the batching loop on the running event loop.
+        
+        The loop is cached here so per-request calls do not have to look
+        it up again.
+        """
+        if self._task is None or self._task.done():
+            self._loop = asyncio.get_running_loop()
+            self._queue = asyncio.Queue()
+            self._task = self._loop.create_task(self.process_loop())
+    
+    async def stop(self):
+        """Stop the batching loop."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+    
+    def add_request(self, item: Any) -> asyncio.Future:
+        """Queue an item for the next batch.
+        
+        Args:
+            item: Item passed to batch_fn
+            
+        Returns:
+            Future resolved with this item's result
+        """
+        future = self._loop.create_future()
+        self._queue.put_nowait((item, future))
+        return future
+    
+    async def _collect_batch(self) -> List[Tuple[Any, asyncio.Future]]:
+        """Wait for the first request, then gather more until full or deadline."""
+        loop = self._loop
+        batch = [await self._queue.get()]
+        deadline = loop.time() + self.max_wait
+        
+        while len(batch) < self.max_batch_size:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+        
+        return batch
+    
+    async def process_loop(self):
+        """Dispatch batches until cancelled."""
+        loop = self._loop
+        
+        while True:
+            batch = await self._collect_batch()
+            items = [item for item, _ in batch]
+            
+            try:
+                results = await loop.run_in_executor(self.executor, self.batch_fn, items)
+            except Exception as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+            
+            for (_, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
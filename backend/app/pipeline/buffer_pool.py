@@ -0,0 +1,69 @@
+"""Pool of reusable uint8 scratch buffers for per-frame byte payloads."""
+import queue
+import threading
+from typing import Dict
+import numpy as np
+
+# Constants
+MIN_BUFFER_BYTES = 64 * 1024  # Smallest size class
+MAX_BUFFERS_PER_SIZE = 4  # Buffers kept per size class; extras are left to the GC
+
+
+class BufferPool:
+    """Thread-safe pool of ``np.uint8`` buffers grouped by power-of-two size.
+
+    Encoded frames vary in size from one request to the next, so buffers are
+    rounded up to a size class and callers slice the returned buffer down to
+    the length they need. Buffers are handed out LIFO so the most recently
+    used (cache-warm) buffer is reused first.
+    """
+
+    def __init__(self, max_per_size: int = MAX_BUFFERS_PER_SIZE):
+        """Initialize buffer pool.
+
+        Args:
+            max_per_size: Maximum number of idle buffers kept per size class
+        """
+        self.max_per_size = max_per_size
+        self._pools: Dict[int, queue.LifoQueue] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _size_class(nbytes: int) -> int:
+        """Round a byte count up to its size class."""
+        return max(MIN_BUFFER_BYTES, 1 << (max(nbytes, 1) - 1).bit_length())
+
+    def _pool_for(self, size: int) -> queue.LifoQueue:
+        """Get (or create) the free list for a size class."""
+        with self._lock:
+            pool = self._pools.get(size)
+            if pool is None:
+                pool = queue.LifoQueue(maxsize=self.max_per_size)
+                self._pools[size] = pool
+            return pool
+
+    def get(self, nbytes: int) -> np.ndarray:
+        """Get a buffer holding at least ``nbytes`` bytes.
+
+        Args:
+            nbytes: Required number of bytes
+
+        Returns:
+            Writable uint8 buffer (may be larger than requested)
+        """
+        size = self._size_class(nbytes)
+        try:
+            return self._pool_for(size).get_nowait()
+        except queue.Empty:
+            return np.empty(size, dtype=np.uint8)
+
+    def put(self, buf: np.ndarray):
+        """Return a buffer obtained from ``get`` to the pool.
+
+        Args:
+            buf: Buffer returned by ``get`` (not a slice of it)
+        """
+        try:
+            self._pool_for(buf.nbytes).put_nowait(buf)
+        except queue.Full:
+            pass
@@ -0,0 +1,340 @@
+"""Image decoding for frames received from the frontend."""
+import struct
+from typing import Optional, Tuple, Union
+import cv2
+import numpy as np
+import torch
+from app.config import config
+from app.pipeline.buffer_pool import BufferPool
+
+# SIMD base64 decoder (falls back to the standard library)
+try:
+    import pybase64 as base64
+    PYBASE64_AVAILABLE = True
+except ImportError:
+    import base64
+    PYBASE64_AVAILABLE = False
+    print("Warning: pybase64 not available. Install with: pip install pybase64")
+
+# GPU JPEG decoding (nvJPEG)
+try:
+    from torchvision.io import decode_jpeg, ImageReadMode
+    GPU_JPEG_AVAILABLE = torch.cuda.is_available()
+except ImportError:
+    GPU_JPEG_AVAILABLE = False
+
+# The opencv-python wheels bundle libjpeg-turbo (SIMD IDCT and colour
+# conversion); a source build may link the much slower stock libjpeg. Distro
+# builds link libjpeg-turbo as plain "libjpeg.so", so this can only confirm it
+OPENCV_JPEG_CODEC = next(
+    (line.split(":", 1)[1].strip()
+     for line in cv2.getBuildInformation().splitlines()
+     if line.strip().startswith("JPEG:")),
+    "unknown"
+)
+LIBJPEG_TURBO_AVAILABLE = "libjpeg-turbo" in OPENCV_JPEG_CODEC
+if not LIBJPEG_TURBO_AVAILABLE:
+    print(f"Warning: could not confirm that OpenCV's JPEG codec ({OPENCV_JPEG_CODEC}) is "
+          "libjpeg-turbo; JPEG decoding may be slow. The opencv-python wheels include it")
+
+DATA_URL_PREFIX = "data:"
+JPEG_MAGIC = b"\xff\xd8\xff"
+# Start-of-frame markers (carry the image size); C4/C8/CC are DHT/JPG/DAC
+JPEG_SOF_MARKERS = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+# Markers without a length field
+JPEG_STANDALONE_MARKERS = frozenset(range(0xD0, 0xDA)) | {0x01}
+PNG_MAGIC = b"\x89PNG\r\n\x1a\n"
+WEBP_MAGIC = b"WEBP"  # Form type at offset 8 of a RIFF container
+
+# imdecode flags per reduction factor; for JPEG the scaling happens inside the
+# IDCT, so the full-resolution image is never materialized
+REDUCED_DECODE_FLAGS = {
+    1: cv2.IMREAD_COLOR,
+    2: cv2.IMREAD_REDUCED_COLOR_2,
+    4: cv2.IMREAD_REDUCED_COLOR_4,
+    8: cv2.IMREAD_REDUCED_COLOR_8,
+}
+
+# Staging buffers for the GPU upload of encoded frames
+_upload_pool = BufferPool()
+
+
+def strip_data_url_prefix(image_data: str) -> str:
+    """Remove a ``data:<mime>;base64,`` prefix if present.
+    
+    Only strings that start with ``data:`` are searched, so the comma scan
+    stops at the end of the short prefix instead of walking the whole payload.
+    
+    Args:
+        image_data: Base64 encoded image, optionally as a data URL
+        
+    Returns:
+        Bare base64 payload
+    """
+    if image_data.startswith(DATA_URL_PREFIX):
+        return image_data[image_data.find(",") + 1:]
+    return image_data
+
+
+def _decode_jpeg_on_gpu(image_bytes: Union[bytes, memoryview]) -> Optional[np.ndarray]:
+    """Decode a JPEG with the GPU's nvJPEG decoder.
+    
+    The perception models consume host arrays, so the decoded frame is copied
+    back once; the IDCT and colour conversion still run on the GPU.
+    
+    Args:
+        image_bytes: JPEG bytes
+        
+    Returns:
+        Decoded BGR image, or None if the GPU decoder fails
+    """
+    # decode_jpeg needs a writable tensor; stage the bytes in a pooled buffer
+    # instead of allocating a fresh bytearray copy per frame
+    nbytes = len(image_bytes)
+    staging = _upload_pool.get(nbytes)
+    try:
+        staging[:nbytes] = np.frombuffer(image_bytes, np.uint8)
+        data = torch.from_numpy(staging[:nbytes])
+        rgb = decode_jpeg(data, mode=ImageReadMode.RGB, device="cuda")
+        return rgb.flip(0).permute(1, 2, 0).contiguous().cpu().numpy()
+    except Exception as e:
+        print(f"Warning: GPU JPEG decode failed, falling back to OpenCV: {e}")
+        return None
+    finally:
+        # .cpu() synchronizes, so the upload has finished reading the buffer
+        _upload_pool.put(staging)
+
+
+def jpeg_dimensions(image_bytes: Union[bytes, memoryview]) -> Optional[Tuple[int, int]]:
+    """Read a JPEG's size from its frame header without decoding it.
+    
+    Args:
+        image_bytes: Encoded image bytes (or a memoryview over them)
+        
+    Returns:
+        (height, width), or None if the data is not a parseable JPEG
+    """
+    if image_bytes[:3] != JPEG_MAGIC:
+        return None
+    
+    size = len(image_bytes)
+    offset = 2
+    try:
+        while offset + 4 <= size:
+            if image_bytes[offset] != 0xFF:
+                return None
+            marker = image_bytes[offset + 1]
+            if marker == 0xFF:
+                # Fill byte before a marker
+                offset += 1
+            elif marker in JPEG_STANDALONE_MARKERS:
+                offset += 2
+            elif marker in JPEG_SOF_MARKERS:
+                # Segment: length(2) precision(1) height(2) width(2)
+                return struct.unpack_from(">HH", image_bytes, offset + 5)
+            else:
+                (length,) = struct.unpack_from(">H", image_bytes, offset + 2)
+                offset += 2 + length
+    except struct.error:
+        return None
+    return None
+
+
+def decode_image_header_from_bytes(
+    image_bytes: Union[bytes, memoryview]
+) -> Optional[Tuple[str, int, int]]:
+    """Read an image's format and size from its header without decoding pixels.
+    
+    JPEG, PNG and WebP (lossy, lossless and extended) are recognized. Use this
+    where only the size is needed (resize ratios, orientation checks) instead
+    of a full imdecode.
+    
+    Args:
+        image_bytes: Encoded image bytes (or a memoryview over them)
+        
+    Returns:
+        (format, width, height) with format "jpeg", "png" or "webp", or None
+        if the format is not recognized or the header is truncated
+    """
+    try:
+        if image_bytes[:3] == JPEG_MAGIC:
+            dimensions = jpeg_dimensions(image_bytes)
+            if dimensions is None:
+                return None
+            height, width = dimensions
+            return "jpeg", width, height
+        
+        if image_bytes[:8] == PNG_MAGIC:
+            # First chunk is IHDR: length(4) type(4) width(4) height(4)
+            width, height = struct.unpack_from(">II", image_bytes, 16)
+            return "png", width, height
+        
+        if image_bytes[:4] == b"RIFF" and image_bytes[8:12] == WEBP_MAGIC:
+            chunk = bytes(image_bytes[12:16])
+            if chunk == b"VP8 ":
+                # Frame tag(3) start code(3), then 14-bit width and height
+                width, height = struct.unpack_from("<HH", image_bytes, 26)
+                return "webp", width & 0x3FFF, height & 0x3FFF
+            if chunk == b"VP8L":
+                # Signature byte, then 14-bit (width - 1) and (height - 1)
+                (bits,) = struct.unpack_from("<I", image_bytes, 21)
+                return "webp", (bits & 0x3FFF) + 1, ((bits >> 14) & 0x3FFF) + 1
+            if chunk == b"VP8X":
+                # Flags(4), then 24-bit (width - 1) and (height - 1)
+                header = bytes(image_bytes[24:30])
+                if len(header) < 6:
+                    return None
+                width = int.from_bytes(header[:3], "little") + 1
+                height = int.from_bytes(header[3:], "little") + 1
+                return "webp", width, height
+    except struct.error:
+        return None
+    return None
+
+
+def select_decode_reduction(image_bytes: Union[bytes, memoryview]) -> int:
+    """Pick the imdecode reduction factor for a frame.
+    
+    With ``config.frame_decode_max_side`` set, oversized JPEGs are decoded at
+    the largest 1/2, 1/4 or 1/8 scale that keeps their long side at or above
+    that size; libjpeg applies the scaling inside the IDCT, so the
+    full-resolution image is never produced. Otherwise the fixed
+    ``config.frame_decode_reduction`` is used.
+    
+    Args:
+        image_bytes: Encoded image bytes (or a memoryview over them)
+        
+    Returns:
+        Reduction factor (1, 2, 4 or 8)
+    """
+    if config.frame_decode_max_side:
+        # Only JPEG scales inside the decoder; other formats would be
+        # decoded at full size and resized by imdecode anyway
+        header = decode_image_header_from_bytes(image_bytes)
+        if header is not None and header[0] == "jpeg":
+            long_side = max(header[1:])
+            for reduction in (8, 4, 2):
+                if long_side >= reduction * config.frame_decode_max_side:
+                    return reduction
+            return 1
+    return config.frame_decode_reduction
+
+
+def decode_image_from_bytes(
+    image_bytes: Union[bytes, memoryview],
+    reduction: Optional[int] = None
+) -> Optional[np.ndarray]:
+    """Decode encoded image bytes (JPEG, PNG, ...) to a BGR numpy array.
+    
+    Frames are decoded at 1/``reduction`` scale; callers reporting
+    coordinates back to the frontend must scale them up again.
+    
+    Args:
+        image_bytes: Encoded image bytes (or a memoryview over them)
+        reduction: 1, 2, 4 or 8 (default: config.frame_decode_reduction)
+        
+    Returns:
+        Decoded image as numpy array, or None if decoding fails
+    """
+    # imdecode raises on an empty buffer instead of returning None
+    if not len(image_bytes):
+        return None
+    
+    if reduction is None:
+        reduction = config.frame_decode_reduction
+    
+    if (
+        config.gpu_jpeg_decode
+        and GPU_JPEG_AVAILABLE
+        and reduction == 1
+        and image_bytes[:3] == JPEG_MAGIC
+    ):
+        image = _decode_jpeg_on_gpu(image_bytes)
+        if image is not None:
+            return image
+    
+    # Zero-copy view over the payload; no staging buffer needed here
+    nparr = np.frombuffer(image_bytes, np.uint8)
+    return cv2.imdecode(nparr, REDUCED_DECODE_FLAGS[reduction])
+
+
+def decode_and_resize_from_bytes(
+    image_bytes: Union[bytes, memoryview],
+    max_side: int
+) -> Tuple[Optional[np.ndarray], float]:
+    """Decode a frame and shrink it so its long side is at most ``max_side``.
+    
+    The bulk of the downscale happens inside libjpeg (reduced decode); a
+    single INTER_AREA resize then covers the remaining non power-of-two
+    factor while the decoded pixels are still in cache. Images already
+    within ``max_side`` are returned as decoded.
+    
+    Args:
+        image_bytes: Encoded image bytes (or a memoryview over them)
+        max_side: Maximum long side of the returned image
+        
+    Returns:
+        (decoded image or None, factor mapping its coordinates to the
+        uploaded frame's)
+    """
+    reduction = select_decode_reduction(image_bytes)
+    image = decode_image_from_bytes(image_bytes, reduction)
+    if image is None and reduction != 1:
+        # Fall back to a full-size decode
+        reduction = 1
+        image = decode_image_from_bytes(image_bytes, reduction)
+    
+    scale = float(reduction)
+    if image is None:
+        return None, scale
+    
+    height, width = image.shape[:2]
+    long_side = max(height, width)
+    if long_side > max_side:
+        factor = max_side / long_side
+        image = cv2.resize(
+            image,
+            (max(1, round(width * factor)), max(1, round(height * factor))),
+            interpolation=cv2.INTER_AREA
+        )
+        scale /= factor
+    return image, scale
+
+
+def decode_frame(image_bytes: Union[bytes, memoryview]) -> Tuple[Optional[np.ndarray], float]:
+    """Decode a frame for the perception pipeline.
+    
+    With ``config.frame_decode_max_side`` set the frame is decoded and
+    resized down to that long side; otherwise it is decoded at the fixed
+    ``config.frame_decode_reduction``.
+    
+    Args:
+        image_bytes: Encoded image bytes (or a memoryview over them)
+        
+    Returns:
+        (decoded image or None, factor mapping its coordinates to the
+        uploaded frame's)
+    """
+    if config.frame_decode_max_side:
+        return decode_and_resize_from_bytes(image_bytes, config.frame_decode_max_side)
+    
+    reduction = config.frame_decode_reduction
+    return decode_image_from_bytes(image_bytes, reduction), float(reduction)
+
+
+def decode_base64_frame(image_data: str) -> Tuple[Optional[np.ndarray], float]:
+    """Decode a base64 frame for the perception pipeline (see decode_frame).
+    
+    Args:
+        image_data: Base64 encoded image (may include data URL prefix)
+        
+    Returns:
+        (decoded image or None, factor mapping its coordinates to the
+        uploaded frame's)
+    """
+    try:
+        image_bytes = base64.b64decode(strip_data_url_prefix(image_data), validate=False)
+        return decode_frame(image_bytes)
+    except Exception as e:
+        print(f"Error decoding image: {e}")
+        return None, 1.0
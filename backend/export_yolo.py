@@ -0,0 +1,53 @@
+"""Export the YOLO checkpoint to quantized TensorRT / OpenVINO models."""
+import argparse
+from ultralytics import YOLO
+from app.config import config
+
+
+def main():
+    """Export YOLO for the requested runtime."""
+    parser = argparse.ArgumentParser(description="Export YOLO to an optimized runtime")
+    parser.add_argument(
+        "--format",
+        choices=["engine", "openvino"],
+        default="engine",
+        help="engine: TensorRT (CUDA), openvino: OpenVINO (CPU)"
+    )
+    parser.add_argument(
+        "--precision",
+        choices=["int8", "fp16"],
+        default="int8",
+        help="Quantization precision (default: int8)"
+    )
+    parser.add_argument(
+        "--data",
+        default="calib.yaml",
+        help="Dataset YAML with ~100 representative frames for INT8 calibration"
+    )
+    parser.add_argument(
+        "--imgsz",
+        type=int,
+        default=config.yolo_imgsz,
+        help=f"Input size (default: {config.yolo_imgsz})"
+    )
+    
+    args = parser.parse_args()
+    
+    model = YOLO(config.yolo_model)
+    int8 = args.precision == "int8"
+    
+    # Dynamic batch profile so batched requests can share the engine
+    path = model.export(
+        format=args.format,
+        int8=int8,
+        half=not int8,
+        data=args.data if int8 else None,
+        imgsz=args.imgsz,
+        dynamic=True,
+        batch=config.batch_max_size
+    )
+    print(f"Exported {args.precision} {args.format} model to {path}")
+
+
+if __name__ == "__main__":
+    main()
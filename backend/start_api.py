@@ -1,10 +1,19 @@
 """Simple script to start the FastAPI server."""
 import uvicorn
+from app.config import config
 
 if __name__ == "__main__":
     print("Starting Smart Glasses API Server...")
     print("API will be available at http://localhost:8000")
     print("Frontend should connect to http://localhost:8000")
     print("\nPress Ctrl+C to stop the server\n")
-    uvicorn.run("app.api:app", host="0.0.0.0", port=8000, reload=True)
-
+    # Auto-reload only in debug mode: it runs a single worker and reloads
+    # the models on every code change. uvicorn's default loop/http "auto"
+    # already picks uvloop/httptools when they are installed
+    uvicorn.run(
+        "app.api:app",
+        host="0.0.0.0",
+        port=8000,
+        reload=config.api_debug,
+        workers=None if config.api_debug else config.api_workers
+    )
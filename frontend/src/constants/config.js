@@ -3,7 +3,8 @@ export const API_CONFIG = {
   WS_URL: 'ws://localhost:8000',
   ENDPOINTS: {
     INPUT_IMAGE: '/input-image-base64', // Kept for backward compatibility
-    WS_VIDEO: '/ws/video',
+    WS_VIDEO: '/ws/video', // Base64 JSON frames, kept for backward compatibility
+    WS_DETECT: '/ws/detect', // Binary JPEG frames
   },
 }
 
@@ -27,7 +27,7 @@ export const useDetection = (videoRef, canvasRef, flipImage, requestInterval) =>
     }
 
     try {
-      const wsUrl = `${API_CONFIG.WS_URL}${API_CONFIG.ENDPOINTS.WS_VIDEO}`
+      const wsUrl = `${API_CONFIG.WS_URL}${API_CONFIG.ENDPOINTS.WS_DETECT}`
       const ws = new WebSocket(wsUrl)
       wsRef.current = ws
 
@@ -228,17 +228,20 @@ export const useDetection = (videoRef, canvasRef, flipImage, requestInterval) =>
         ctx.drawImage(video, 0, 0, canvas.width, canvas.height)
       }
 
-      // Convert canvas to base64
-      const imageData = canvas.toDataURL('image/jpeg', 0.8)
-
       setIsProcessing(true)
       isProcessingRef.current = true
 
-      // Send frame via WebSocket
-      wsRef.current.send(JSON.stringify({
-        type: 'frame',
-        image: imageData
-      }))
+      // Encode to JPEG and send the raw bytes as a binary frame
+      // (no base64 inflation, no base64 decode on the server)
+      canvas.toBlob((blob) => {
+        const ws = wsRef.current
+        if (!blob || !ws || ws.readyState !== WebSocket.OPEN) {
+          setIsProcessing(false)
+          isProcessingRef.current = false
+          return
+        }
+        ws.send(blob)
+      }, 'image/jpeg', 0.8)
     } catch (err) {
       console.error('Error capturing frame:', err)
       setIsProcessing(false)